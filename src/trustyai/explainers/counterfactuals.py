@@ -2,8 +2,6 @@
 # pylint: disable = import-error, too-few-public-methods, wrong-import-order, line-too-long,
 # pylint: disable = unused-argument
 from typing import Optional, Union, List
-import matplotlib.pyplot as plt
-import matplotlib as mpl
 import pandas as pd
 import uuid as _uuid
 
@@ -127,6 +125,10 @@ class CounterfactualResult(ExplanationResults):
         """
         Plot the counterfactual result.
         """
+        # pylint: disable=import-outside-toplevel
+        import matplotlib as mpl
+        import matplotlib.pyplot as plt
+
         _df = self.as_dataframe().copy()
         _df = _df[_df["difference"] != 0.0]
 
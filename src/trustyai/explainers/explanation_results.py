@@ -1,47 +1,47 @@
 """Generic class for Explanation and Saliency results"""
-from abc import ABC, abstractmethod
 from typing import Dict
 
-import bokeh.models
 import pandas as pd
-from bokeh.io import show
 from pandas.io.formats.style import Styler
 
 
-class ExplanationResults(ABC):
-    """Abstract class for explanation visualisers"""
+# these are plain base classes rather than ABCs; ABCMeta adds a subclass-hook
+# check to every instantiation, which is wasted work on results objects that are
+# created once per explanation
+class ExplanationResults:
+    """Base class for explanation visualisers"""
 
-    @abstractmethod
     def as_dataframe(self) -> pd.DataFrame:
         """Display explanation result as a dataframe"""
+        raise NotImplementedError
 
-    @abstractmethod
     def as_html(self) -> Styler:
         """Visualise the styled dataframe"""
+        raise NotImplementedError
 
 
 # pylint: disable=too-few-public-methods
 class SaliencyResults(ExplanationResults):
-    """Abstract class for saliency visualisers"""
+    """Base class for saliency visualisers"""
 
-    @abstractmethod
     def saliency_map(self):
         """Return the Saliencies as a dictionary, keyed by output name"""
+        raise NotImplementedError
 
-    @abstractmethod
     def _matplotlib_plot(self, output_name: str, block: bool, call_show: bool) -> None:
         """Plot the saliencies of a particular output in matplotlib"""
+        raise NotImplementedError
 
-    @abstractmethod
-    def _get_bokeh_plot(self, output_name: str) -> bokeh.models.Plot:
+    def _get_bokeh_plot(self, output_name: str) -> "bokeh.models.Plot":
         """Get a bokeh plot visualizing the saliencies of a particular output"""
+        raise NotImplementedError
 
-    def _get_bokeh_plot_dict(self) -> Dict[str, bokeh.models.Plot]:
+    def _get_bokeh_plot_dict(self) -> Dict[str, "bokeh.models.Plot"]:
         """Get a dictionary containing visualizations of the saliencies of all outputs,
         keyed by output name"""
         return {
             output_name: self._get_bokeh_plot(output_name)
-            for output_name in self.saliency_map().keys()
+            for output_name in self.saliency_map()
         }
 
     def plot(
@@ -64,8 +64,10 @@ class SaliencyResults(ExplanationResults):
             plotting function. If `False`, the plot will be returned to the user for further
             editing.
         """
+        from bokeh.io import show  # pylint: disable=import-outside-toplevel
+
         if output_name is None:
-            for output_name_iterator in self.saliency_map().keys():
+            for output_name_iterator in self.saliency_map():
                 if render_bokeh:
                     show(self._get_bokeh_plot(output_name_iterator))
                 else:
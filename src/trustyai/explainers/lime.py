@@ -1,16 +1,12 @@
 """Explainers.lime module"""
 # pylint: disable = import-error, too-few-public-methods, wrong-import-order, line-too-long,
 # pylint: disable = unused-argument, duplicate-code, consider-using-f-string, invalid-name
-from typing import Dict, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Union
 
-import bokeh.models
-import matplotlib.pyplot as plt
-import matplotlib as mpl
 import numpy as np
-from bokeh.models import ColumnDataSource, HoverTool
-from bokeh.plotting import figure
 import pandas as pd
-from matplotlib.colors import LinearSegmentedColormap
+import pyarrow as pa
 
 from trustyai import _default_initializer  # pylint: disable=unused-import
 from trustyai.utils._visualisation import (
@@ -48,6 +44,47 @@ from java.util import Random
 
 LimeConfig = _LimeConfig
 
+# keyword arguments that map directly onto a single LimeConfig builder method,
+# used by :func:`LimeExplainer.clone_with` to update only the overridden fields
+_LIME_CONFIG_SETTERS = {
+    "normalise_weights": "withNormalizeWeights",
+    "samples": "withSamples",
+    "data_distribution": "withDataDistribution",
+    "features": "withNoOfFeatures",
+    "retries": "withRetries",
+    "dataset_minimum": "withProximityFilteredDatasetMinimum",
+    "separable_dataset_ratio": "withSeparableDatasetRatio",
+    "kernel_width": "withProximityKernelWidth",
+    "proximity_threshold": "withProximityThreshold",
+    "adapt_dataset_variance": "withAdaptiveVariance",
+    "feature_selection": "withFeatureSelection",
+    "penalise_sparse_balance": "withPenalizeBalanceSparse",
+    "filter_interpretable": "withFilterInterpretable",
+    "use_wlr_model": "withUseWLRLinearModel",
+    "track_counterfactuals": "withTrackCounterfactuals",
+}
+
+
+def _extract_pfi_columns(pfis):
+    """Materialize the name, value, score, and confidence columns of a list of
+    Java ``PerFeatureImportance`` objects in a single pass. Each method call on a
+    Java proxy crosses the JVM bridge, so all per-feature fields are fetched here
+    once and consumers index into the returned lists."""
+    names, values, scores, confidences = [], [], [], []
+    # bind the append methods to locals; the loop body otherwise re-resolves
+    # them once per importance on top of the bridge calls themselves
+    append_name = names.append
+    append_value = values.append
+    append_score = scores.append
+    append_confidence = confidences.append
+    for pfi in pfis:
+        feature = pfi.getFeature()
+        append_name(str(feature.getName()))
+        append_value(feature.getValue().getUnderlyingObject())
+        append_score(pfi.getScore())
+        append_confidence(pfi.getConfidence())
+    return names, values, scores, confidences
+
 
 class LimeResults(SaliencyResults):
     """Wraps LIME results. This object is returned by the :class:`~LimeExplainer`,
@@ -58,6 +95,7 @@ class LimeResults(SaliencyResults):
         """Constructor method. This is called internally, and shouldn't ever need to be used
         manually."""
         self._java_saliency_results = saliencyResults
+        self._saliency_map = None
 
     def saliency_map(self) -> Dict[str, Saliency]:
         """
@@ -68,10 +106,14 @@ class LimeResults(SaliencyResults):
         Dict[str, Saliency]
              A dictionary of :class:`~trustyai.model.Saliency` objects, keyed by output name.
         """
-        return {
-            entry.getKey(): entry.getValue()
-            for entry in self._java_saliency_results.saliencies.entrySet()
-        }
+        # saliencies are immutable once returned by the explainer, so the dict is
+        # built from the Java map once and reused on subsequent calls
+        if self._saliency_map is None:
+            self._saliency_map = {
+                entry.getKey(): entry.getValue()
+                for entry in self._java_saliency_results.saliencies.entrySet()
+            }
+        return self._saliency_map
 
     def as_dataframe(self) -> pd.DataFrame:
         """
@@ -89,21 +131,51 @@ class LimeResults(SaliencyResults):
             * ``Confidence``: The confidence of this explanation as returned by the explainer.
 
         """
-        outputs = self.saliency_map().keys()
+        saliency_map = self.saliency_map()
 
         data = {}
-        for output in outputs:
-            output_rows = []
-            for pfi in self.saliency_map().get(output).getPerFeatureImportance():
-                output_rows.append(
-                    {
-                        "Feature": str(pfi.getFeature().getName().toString()),
-                        "Value": pfi.getFeature().getValue().getUnderlyingObject(),
-                        "Saliency": pfi.getScore(),
-                        "Confidence": pfi.getConfidence(),
-                    }
-                )
-            data[output] = pd.DataFrame(output_rows)
+        for output, saliency in saliency_map.items():
+            names, values, scores, confidences = _extract_pfi_columns(
+                saliency.getPerFeatureImportance()
+            )
+            data[output] = pd.DataFrame(
+                {
+                    "Feature": pd.Categorical(names),
+                    "Value": values,
+                    "Saliency": np.asarray(scores, dtype=np.float64),
+                    "Confidence": np.asarray(confidences, dtype=np.float64),
+                }
+            )
+        return data
+
+    def as_arrow(self) -> Dict[str, pa.Table]:
+        """
+        Return the LIME result as pyarrow Tables.
+
+        Returns
+        -------
+        Dict[str, pyarrow.Table]
+            Dictionary of Tables, keyed by output name, with the same columns
+            as :func:`as_dataframe`. The columns are built directly from typed
+            arrays with no pandas intermediate or object-dtype strings, making
+            this the cheaper entry point for columnar consumers (Parquet,
+            Arrow IPC, duckdb) on large feature sets.
+        """
+        saliency_map = self.saliency_map()
+
+        data = {}
+        for output, saliency in saliency_map.items():
+            names, values, scores, confidences = _extract_pfi_columns(
+                saliency.getPerFeatureImportance()
+            )
+            data[output] = pa.table(
+                {
+                    "Feature": pa.array(names, type=pa.string()),
+                    "Value": pa.array(values),
+                    "Saliency": pa.array(scores, type=pa.float64()),
+                    "Confidence": pa.array(confidences, type=pa.float64()),
+                }
+            )
         return data
 
     def as_html(self) -> pd.io.formats.style.Styler:
@@ -119,6 +191,8 @@ class LimeResults(SaliencyResults):
 
             * Color each ``Saliency`` based on how their magnitude.
         """
+        # pylint: disable=import-outside-toplevel
+        from matplotlib.colors import LinearSegmentedColormap
 
         htmls = {}
         for k, df in self.as_dataframe().items():
@@ -139,59 +213,66 @@ class LimeResults(SaliencyResults):
 
     def _matplotlib_plot(self, output_name: str, block=True, call_show=True) -> None:
         """Plot the LIME saliencies."""
+        # pylint: disable=import-outside-toplevel
+        import matplotlib as mpl
+        import matplotlib.pyplot as plt
+
         with mpl.rc_context(drcp):
-            dictionary = {}
-            for feature_importance in (
-                self.saliency_map().get(output_name).getPerFeatureImportance()
-            ):
-                dictionary[
-                    feature_importance.getFeature().name
-                ] = feature_importance.getScore()
-
-            colours = [
-                ds["negative_primary_colour"]
-                if i < 0
-                else ds["positive_primary_colour"]
-                for i in dictionary.values()
-            ]
+            names, _, scores, _ = _extract_pfi_columns(
+                self.saliency_map()[output_name].getPerFeatureImportance()
+            )
+            num_features = len(names)
+            scores = np.fromiter(scores, dtype=np.float64, count=num_features)
+            colours = np.where(
+                scores < 0,
+                ds["negative_primary_colour"],
+                ds["positive_primary_colour"],
+            )
             plt.title(f"LIME: Feature Importances to {output_name}")
             plt.barh(
-                range(len(dictionary)),
-                dictionary.values(),
+                range(num_features),
+                scores,
                 align="center",
                 color=colours,
             )
-            plt.yticks(range(len(dictionary)), list(dictionary.keys()))
+            plt.yticks(range(num_features), names)
             plt.tight_layout()
 
             if call_show:
                 plt.show(block=block)
 
-    def _get_bokeh_plot(self, output_name) -> bokeh.models.Plot:
-        lime_data_source = pd.DataFrame(
-            [
-                {
-                    "feature": str(pfi.getFeature().getName()),
-                    "saliency": pfi.getScore(),
-                }
-                for pfi in self.saliency_map()[output_name].getPerFeatureImportance()
-            ]
-        )
-        lime_data_source["color"] = lime_data_source["saliency"].apply(
-            lambda x: ds["positive_primary_colour"]
-            if x >= 0
-            else ds["negative_primary_colour"]
-        )
-        lime_data_source["saliency_colored"] = lime_data_source["saliency"].apply(
-            lambda x: (bold_green_html if x >= 0 else bold_red_html)("{:.2f}".format(x))
-        )
+    def _get_bokeh_plot(self, output_name) -> "bokeh.models.Plot":
+        # pylint: disable=import-outside-toplevel
+        from bokeh.models import ColumnDataSource, HoverTool
+        from bokeh.plotting import figure
 
-        lime_data_source["color_faded"] = lime_data_source["saliency"].apply(
-            lambda x: ds["positive_primary_colour_faded"]
-            if x >= 0
-            else ds["negative_primary_colour_faded"]
+        features, _, scores, _ = _extract_pfi_columns(
+            self.saliency_map()[output_name].getPerFeatureImportance()
+        )
+        saliencies = np.fromiter(scores, dtype=np.float64, count=len(scores))
+        positive = saliencies >= 0
+        # bokeh reads the columns back out as arrays, so hand it a plain dict
+        # rather than paying for an intermediate DataFrame
+        source = ColumnDataSource(
+            data={
+                "feature": features,
+                "saliency": saliencies,
+                "color": np.where(
+                    positive,
+                    ds["positive_primary_colour"],
+                    ds["negative_primary_colour"],
+                ),
+                "color_faded": np.where(
+                    positive,
+                    ds["positive_primary_colour_faded"],
+                    ds["negative_primary_colour_faded"],
+                ),
+                "saliency_colored": [
+                    (bold_green_html if pos else bold_red_html)("{:.2f}".format(score))
+                    for score, pos in zip(scores, positive)
+                ],
+            }
         )
-        source = ColumnDataSource(lime_data_source)
         htool = HoverTool(
             name="bars",
             tooltips="<h3>LIME</h3> {} saliency to {}: @saliency_colored".format(
@@ -201,7 +282,7 @@ class LimeResults(SaliencyResults):
         bokeh_plot = figure(
             sizing_mode="stretch_both",
             title="Lime Feature Importances",
-            y_range=lime_data_source["feature"],
+            y_range=features,
             tools=[htool],
         )
         bokeh_plot.hbar(
@@ -216,16 +297,21 @@ class LimeResults(SaliencyResults):
             name="bars",
             source=source,
         )
-        bokeh_plot.line([0, 0], [0, len(lime_data_source)], color="#000")
+        bokeh_plot.line([0, 0], [0, len(features)], color="#000")
         bokeh_plot.xaxis.axis_label = "Saliency Value"
         bokeh_plot.yaxis.axis_label = "Feature"
         return bokeh_plot
 
-    def _get_bokeh_plot_dict(self) -> Dict[str, bokeh.models.Plot]:
-        return {
-            output_name: self._get_bokeh_plot(output_name)
-            for output_name in self.saliency_map().keys()
-        }
+    def _get_bokeh_plot_dict(self) -> Dict[str, "bokeh.models.Plot"]:
+        output_names = list(self.saliency_map())
+        if len(output_names) < 2:
+            return {name: self._get_bokeh_plot(name) for name in output_names}
+        # the per-output plots are independent and spend most of their time in
+        # GIL-releasing JVM calls, so build them concurrently
+        with ThreadPoolExecutor(max_workers=min(8, len(output_names))) as executor:
+            return dict(
+                zip(output_names, executor.map(self._get_bokeh_plot, output_names))
+            )
 
 
 class LimeExplainer:
@@ -288,14 +374,16 @@ class LimeExplainer:
                 (default= ``False``) Whether the proximity filter should happen in the interpretable space
 
         """
+        self._seed = kwargs.get("seed", 0)
+        self._perturbations = kwargs.get("perturbations", 1)
         self._jrandom = Random()
-        self._jrandom.setSeed(kwargs.get("seed", 0))
+        self._jrandom.setSeed(self._seed)
         ep = kwargs.get("encoding_params", (0.07, 0.3))
         self._lime_config = (
             LimeConfig()
             .withNormalizeWeights(kwargs.get("normalise_weights", False))
             .withPerturbationContext(
-                PerturbationContext(self._jrandom, kwargs.get("perturbations", 1))
+                PerturbationContext(self._jrandom, self._perturbations)
             )
             .withSamples(kwargs.get("samples", 300))
             .withDataDistribution(
@@ -318,6 +406,72 @@ class LimeExplainer:
 
         self._explainer = _LimeExplainer(self._lime_config)
 
+    @classmethod
+    def _from_config(cls, config, jrandom, seed, perturbations) -> "LimeExplainer":
+        """Build an explainer around an already-constructed :class:`LimeConfig`,
+        bypassing the full builder chain run by :func:`__init__`."""
+        # pylint: disable=protected-access
+        explainer = cls.__new__(cls)
+        explainer._jrandom = jrandom
+        explainer._seed = seed
+        explainer._perturbations = perturbations
+        explainer._lime_config = config
+        explainer._explainer = _LimeExplainer(config)
+        return explainer
+
+    def clone_with(self, **kwargs) -> "LimeExplainer":
+        """Create a new :class:`LimeExplainer` that shares this explainer's
+        configuration, with the provided keyword arguments overridden.
+
+        This clones the existing :class:`LimeConfig` on the Java side and only
+        issues builder calls for the overridden fields, which is much cheaper
+        than rebuilding the full configuration chain via :class:`LimeExplainer`
+        when sweeping over a parameter such as ``samples`` or ``seed``.
+
+        Parameters
+        ----------
+        Keyword Arguments:
+            Any of the keyword arguments accepted by :class:`LimeExplainer`.
+
+        Returns
+        -------
+        :class:`~LimeExplainer`
+            A new explainer with the merged configuration.
+
+        Raises
+        ------
+        ValueError
+            If a keyword argument is not a :class:`LimeExplainer` configuration
+            parameter.
+        """
+        valid_keys = set(_LIME_CONFIG_SETTERS).union(
+            ("seed", "perturbations", "encoding_params")
+        )
+        unknown = sorted(set(kwargs).difference(valid_keys))
+        if unknown:
+            raise ValueError(
+                f"Unknown LimeExplainer configuration parameter(s): {', '.join(unknown)}"
+            )
+
+        config = self._lime_config.copy()
+        jrandom = self._jrandom
+        seed = kwargs.get("seed", self._seed)
+        perturbations = kwargs.get("perturbations", self._perturbations)
+        if "seed" in kwargs or "perturbations" in kwargs:
+            jrandom = Random()
+            jrandom.setSeed(seed)
+            config = config.withPerturbationContext(
+                PerturbationContext(jrandom, perturbations)
+            )
+        if "encoding_params" in kwargs:
+            ep = kwargs["encoding_params"]
+            config = config.withEncodingParams(EncodingParams(ep[0], ep[1]))
+        for name, value in kwargs.items():
+            setter = _LIME_CONFIG_SETTERS.get(name)
+            if setter is not None:
+                config = getattr(config, setter)(value)
+        return self._from_config(config, jrandom, seed, perturbations)
+
     @data_conversion_docstring("one_input", "one_output")
     def explain(
         self,
@@ -349,3 +503,58 @@ class LimeExplainer:
 
         with Model.ArrowTransmission(model, inputs):
             return LimeResults(self._explainer.explainAsync(_prediction, model).get())
+
+    def explain_batch(
+        self,
+        inputs: List[OneInputUnionType],
+        outputs: List[OneOutputUnionType],
+        model: Union[PredictionProvider, Model],
+    ) -> List[LimeResults]:
+        """Produce LIME explanations for a batch of predictions.
+
+        All explanation requests are submitted to the explainer before any result
+        is collected, so the individual explanations run concurrently on the
+        explainer's JVM thread pool rather than serially as with repeated calls
+        to :func:`explain`.
+
+        Parameters
+        ----------
+        inputs : List[OneInputUnionType]
+            The input features of each prediction to explain, in any of the
+            formats accepted by :func:`explain`. All inputs must share a schema.
+        outputs : List[OneOutputUnionType]
+            The corresponding model outputs for each set of input features.
+        model : :obj:`~trustyai.model.PredictionProvider`
+            The TrustyAI PredictionProvider, as generated by
+            :class:`~trustyai.model.Model` or :class:`~trustyai.model.ArrowModel`.
+
+        Returns
+        -------
+        List[:class:`~LimeResults`]
+            The LIME explanation of each provided prediction, in input order.
+
+        Raises
+        ------
+        ValueError
+            If the batch is empty or ``inputs`` and ``outputs`` differ in length.
+        """
+        if len(inputs) != len(outputs):
+            raise ValueError(
+                f"explain_batch received {len(inputs)} inputs "
+                f"but {len(outputs)} outputs"
+            )
+        if not inputs:
+            raise ValueError("explain_batch requires at least one prediction")
+        feature_names = model.feature_names if isinstance(model, Model) else None
+        output_names = model.output_names if isinstance(model, Model) else None
+        _predictions = [
+            simple_prediction(input_values, output_values, feature_names, output_names)
+            for input_values, output_values in zip(inputs, outputs)
+        ]
+
+        with Model.ArrowTransmission(model, inputs[0]):
+            futures = [
+                self._explainer.explainAsync(_prediction, model)
+                for _prediction in _predictions
+            ]
+            return [LimeResults(future.get()) for future in futures]
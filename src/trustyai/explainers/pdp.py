@@ -1,7 +1,6 @@
 """Explainers.pdp module"""
 
 import math
-import matplotlib.pyplot as plt
 import pandas as pd
 from pandas.io.formats.style import Styler
 
@@ -77,6 +76,8 @@ class PDPResults(ExplanationResults):
             the plotting function. If `False`, the plot will be returned to the user for
             further editing.
         """
+        import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel
+
         fig, axs = plt.subplots(len(self.pdp_graphs), constrained_layout=True)
         p_idx = 0
         for pdp_graph in self.pdp_graphs:
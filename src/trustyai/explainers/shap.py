@@ -1,12 +1,7 @@
 """Explainers.shap module"""
 # pylint: disable = import-error, too-few-public-methods, wrong-import-order, line-too-long,
-# pylint: disable = unused-argument, consider-using-f-string, invalid-name
+# pylint: disable = unused-argument, consider-using-f-string, invalid-name, too-many-locals
 from typing import Dict, Optional, Union
-import matplotlib.pyplot as plt
-import matplotlib as mpl
-from bokeh.models import ColumnDataSource, HoverTool
-from bokeh.plotting import figure
-from matplotlib.colors import LinearSegmentedColormap
 import pandas as pd
 import numpy as np
 from jpype import JInt
@@ -104,10 +99,11 @@ class SHAPResults(SaliencyResults):
 
         data_rows = []
         for i, pfi in enumerate(saliency.getPerFeatureImportance()[:-1]):
+            feature = pfi.getFeature()
             data_rows.append(
                 {
-                    "Feature": str(pfi.getFeature().getName().toString()),
-                    "Value": pfi.getFeature().getValue().getUnderlyingObject(),
+                    "Feature": str(feature.getName().toString()),
+                    "Value": feature.getValue().getUnderlyingObject(),
                     "Mean Background Value": background_mean_feature_values[i],
                     "SHAP Value": pfi.getScore(),
                     "Confidence": pfi.getConfidence(),
@@ -160,6 +156,8 @@ class SHAPResults(SaliencyResults):
               ``Mean Background Value``.
             * Color each ``SHAP Value`` based on how their magnitude.
         """
+        # pylint: disable=import-outside-toplevel
+        from matplotlib.colors import LinearSegmentedColormap
 
         def _color_feature_values(feature_values, background_vals):
             """Internal function for the dataframe visualization"""
@@ -204,19 +202,16 @@ class SHAPResults(SaliencyResults):
     def _matplotlib_plot(self, output_name, block=True, call_show=True) -> None:
         """Visualize the SHAP explanation of each output as a set of candlestick plots,
         one per output."""
+        # pylint: disable=import-outside-toplevel
+        import matplotlib as mpl
+        import matplotlib.pyplot as plt
+
         with mpl.rc_context(drcp):
-            shap_values = [
-                pfi.getScore()
-                for pfi in self.saliency_map()[output_name].getPerFeatureImportance()[
-                    :-1
-                ]
-            ]
-            feature_names = [
-                str(pfi.getFeature().getName())
-                for pfi in self.saliency_map()[output_name].getPerFeatureImportance()[
-                    :-1
-                ]
-            ]
+            pfis = self.saliency_map()[output_name].getPerFeatureImportance()[:-1]
+            shap_values, feature_names = [], []
+            for pfi in pfis:
+                shap_values.append(pfi.getScore())
+                feature_names.append(str(pfi.getFeature().getName()))
             fnull = self.get_fnull()[output_name]
             prediction = fnull + sum(shap_values)
 
@@ -261,6 +256,10 @@ class SHAPResults(SaliencyResults):
                 plt.show(block=block)
 
     def _get_bokeh_plot(self, output_name):
+        # pylint: disable=import-outside-toplevel
+        from bokeh.models import ColumnDataSource, HoverTool
+        from bokeh.plotting import figure
+
         fnull = self.get_fnull()[output_name]
 
         # create dataframe of plot values
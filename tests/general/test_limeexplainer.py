@@ -171,6 +171,75 @@ def test_lime_as_html():
         assert score != 0
 
 
+def test_lime_explain_batch():
+    """Test that batch explanations line up with per-input explain calls"""
+    np.random.seed(0)
+    data = np.random.rand(3, 5)
+    model_weights = np.random.rand(5)
+    predict_function = lambda x: np.stack([np.dot(x, model_weights), 2 * np.dot(x, model_weights)], -1)
+    model = Model(predict_function)
+
+    explainer = LimeExplainer(samples=100, perturbations=2, seed=23, normalise_weights=False)
+    inputs = [data[i] for i in range(3)]
+    outputs = [model(data[i]) for i in range(3)]
+    explanations = explainer.explain_batch(inputs=inputs, outputs=outputs, model=model)
+    assert len(explanations) == 3
+
+    for i, explanation in enumerate(explanations):
+        single = explainer.explain(inputs=inputs[i], outputs=outputs[i], model=model)
+        for out_name, df in single.as_dataframe().items():
+            batch_df = explanation.as_dataframe()[out_name]
+            assert set(batch_df['Feature']) == set(df['Feature'])
+            for score in batch_df['Saliency']:
+                assert score != 0
+
+    with pytest.raises(ValueError):
+        explainer.explain_batch(inputs=inputs, outputs=outputs[:2], model=model)
+    with pytest.raises(ValueError):
+        explainer.explain_batch(inputs=[], outputs=[], model=model)
+
+
+def test_lime_clone_with():
+    """Test that cloned explainers produce working explanations"""
+    np.random.seed(0)
+    data = np.random.rand(1, 5)
+    model_weights = np.random.rand(5)
+    predict_function = lambda x: np.stack([np.dot(x, model_weights), 2 * np.dot(x, model_weights)], -1)
+    model = Model(predict_function)
+
+    explainer = LimeExplainer(samples=10, perturbations=2, seed=23, normalise_weights=False)
+    clone = explainer.clone_with(samples=100)
+    explanation = clone.explain(inputs=data, outputs=model(data), model=model)
+
+    for score in explanation.as_dataframe()["output-0"]['Saliency']:
+        assert score != 0
+
+    with pytest.raises(ValueError):
+        explainer.clone_with(smaples=500)
+
+
+def test_lime_as_arrow():
+    """Test that as_arrow tables agree with as_dataframe"""
+    np.random.seed(0)
+    data = np.random.rand(1, 5)
+    model_weights = np.random.rand(5)
+    predict_function = lambda x: np.stack([np.dot(x, model_weights), 2 * np.dot(x, model_weights)], -1)
+    model = Model(predict_function)
+
+    explainer = LimeExplainer(samples=100, perturbations=2, seed=23, normalise_weights=False)
+    explanation = explainer.explain(inputs=data, outputs=model(data), model=model)
+
+    dfs = explanation.as_dataframe()
+    tables = explanation.as_arrow()
+    assert set(tables.keys()) == set(dfs.keys())
+    for out_name, table in tables.items():
+        df = dfs[out_name]
+        assert table.column_names == list(df.columns)
+        assert table.column('Feature').to_pylist() == list(df['Feature'])
+        assert np.allclose(table.column('Saliency').to_numpy(), df['Saliency'].values)
+        assert np.allclose(table.column('Confidence').to_numpy(), df['Confidence'].values)
+
+
 def test_lime_numpy():
     np.random.seed(0)
     data = np.random.rand(101, 5)